@@ -0,0 +1,425 @@
+"""
+End-to-end smoke tests for the Interview Tracker API.
+
+Start the server (``python interview_api.py``) and run:
+    python test_interview_apis.py
+
+All requests share one ``httpx.AsyncClient`` connection pool, and tests
+with no data dependency between them run concurrently via
+``asyncio.gather``; only the interview chain (needs company/role ids)
+is serialized. The suite finishes in a handful of round trips instead
+of one per test.
+
+With HTTP/2 enabled on the client, a whole gather wave shares one
+multiplexed connection when the server is fronted by an h2-capable
+proxy; against plain uvicorn it degrades to HTTP/1.1 keep-alive.
+
+The file is also collectable by pytest (requires pytest-asyncio):
+    pytest -n auto --dist=loadfile interviewapis/test_interview_apis.py
+Use --dist=loadfile under pytest-xdist so the ordered create/get/update
+chain stays on one worker; tests run in definition order there.
+"""
+
+import asyncio
+import os
+
+import httpx
+import msgspec
+import orjson
+import pytest
+import pytest_asyncio
+
+BASE_URL = "http://127.0.0.1:8000"
+
+# pretty-printing every body costs a JSON parse plus an indented re-dump
+# per call; keep the suite quiet unless explicitly asked
+VERBOSE = os.getenv("TEST_VERBOSE") == "1"
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client():
+    async with httpx.AsyncClient(
+        base_url=BASE_URL,
+        # multiplexes concurrent requests over one stream when the server
+        # negotiates h2 (TLS/ALPN); falls back to HTTP/1.1 keep-alive
+        http2=True,
+        timeout=10,
+        limits=httpx.Limits(max_keepalive_connections=8),
+    ) as c:
+        yield c
+
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# bare paths: the client carries base_url, so httpx joins each request
+# against the already-parsed base instead of re-parsing a full URL per
+# call; parameterized routes use printf templates filled at call time
+URL_ROOT = "/"
+URL_HEALTH = "/api/health"
+URL_COMPANIES = "/api/companies/"
+URL_ROLES = "/api/roles/"
+URL_SKILLS = "/api/skills/"
+URL_QUESTIONS = "/api/questions/"
+URL_INTERVIEWS = "/api/interviews/"
+URL_STATS = "/api/stats/overview"
+URL_COMPANY_TMPL = "/api/companies/%s"
+URL_QUESTION_TMPL = "/api/questions/%s"
+URL_INTERVIEW_TMPL = "/api/interviews/%s"
+URL_INTERVIEW_QUESTIONS_TMPL = "/api/interviews/%s/questions"
+URL_INTERVIEW_ROUNDS_TMPL = "/api/interviews/%s/rounds"
+
+# static request bodies serialized once at import; each call sends the
+# same bytes instead of re-running json.dumps per request
+COMPANY_BODY = orjson.dumps(
+    {
+        "company_name": "Acme Corp",
+        "industry": "Technology",
+        "website": "https://acme.example.com",
+        "headquarters": "San Francisco, CA",
+        "company_size": "1000-5000",
+    }
+)
+ROLE_BODY = orjson.dumps(
+    {
+        "role_title": "Senior Product Manager",
+        "role_category": "Product",
+        "seniority_level": "senior",
+        "description": "Owns the analytics product line.",
+    }
+)
+SKILL_BODY = orjson.dumps(
+    {
+        "skill_name": "System Design",
+        "skill_category": "Technical",
+        "description": "Designing scalable distributed systems.",
+    }
+)
+QUESTION_BODY = orjson.dumps(
+    {
+        "question_text": "Design a URL shortener that handles 100M requests/day.",
+        "question_category": "system_design",
+        "question_difficulty": "hard",
+        "tags": ["scalability", "databases"],
+        "source": "Glassdoor",
+    }
+)
+QUESTION_UPDATE_BODY = orjson.dumps({"question_difficulty": "medium"})
+INTERVIEW_UPDATE_BODY = orjson.dumps(
+    {"interview_status": "completed", "interview_result": "passed"}
+)
+ROUND_BODY = orjson.dumps(
+    {
+        "round_number": 1,
+        "round_type": "system_design",
+        "round_status": "completed",
+        "round_result": "passed",
+        "interviewer_name": "John Smith",
+    }
+)
+
+class IdResp(msgspec.Struct):
+    """Just the id fields of any create response.
+
+    msgspec skips the unknown keys and decodes straight into a C struct,
+    so pulling an id out of a reply costs a single typed parse instead
+    of materializing the whole body as dicts.
+    """
+
+    company_id: int | None = None
+    role_id: int | None = None
+    skill_id: int | None = None
+    question_id: int | None = None
+    interview_id: int | None = None
+
+
+_ID_DECODER = msgspec.json.Decoder(IdResp)
+
+# ids created early in the run and reused by later tests
+company_id = None
+role_id = None
+skill_id = None
+question_id = None
+interview_id = None
+
+
+async def _do(client, method, path, body=None, params=None):
+    """Single dispatch point for every API call.
+
+    Keeps per-test code down to payload + assertions; the preserialized
+    bodies go out as raw bytes with an explicit Content-Type.
+    """
+    return await client.request(
+        method,
+        path,
+        content=body,
+        params=params,
+        headers=JSON_HEADERS if body is not None else None,
+    )
+
+
+def print_response(name, response, body=None):
+    print(f"\n=== {name} ===")
+    print(f"Status: {response.status_code}")
+    if not VERBOSE:
+        return
+    if body is None:
+        try:
+            body = response.json()
+        except ValueError:
+            print(response.text[:300])
+            return
+    print(orjson.dumps(body, option=orjson.OPT_INDENT_2).decode())
+
+
+async def test_root(client):
+    response = await _do(client, "GET", URL_ROOT)
+    print_response("GET /", response)
+    assert response.status_code == 200
+
+
+async def test_health(client):
+    response = await _do(client, "GET", URL_HEALTH)
+    body = response.json()
+    print_response("GET /api/health", response, body)
+    assert response.status_code == 200
+    assert body["status"] == "healthy"
+
+
+async def test_create_company(client):
+    global company_id
+    response = await _do(client, "POST", URL_COMPANIES, COMPANY_BODY)
+    print_response("POST /api/companies/", response)
+    assert response.status_code == 201
+    company_id = _ID_DECODER.decode(response.content).company_id
+
+
+async def test_list_companies(client):
+    response = await _do(client, "GET", URL_COMPANIES)
+    body = response.json()
+    print_response("GET /api/companies/", response, body)
+    assert response.status_code == 200
+    assert len(body) >= 1
+
+
+async def test_get_company(client):
+    response = await _do(client, "GET", URL_COMPANY_TMPL % company_id)
+    body = response.json()
+    print_response("GET /api/companies/{id}", response, body)
+    assert response.status_code == 200
+    assert body["company_name"] == "Acme Corp"
+
+
+async def test_create_role(client):
+    global role_id
+    response = await _do(client, "POST", URL_ROLES, ROLE_BODY)
+    print_response("POST /api/roles/", response)
+    assert response.status_code == 201
+    role_id = _ID_DECODER.decode(response.content).role_id
+
+
+async def test_list_roles(client):
+    response = await _do(client, "GET", URL_ROLES)
+    body = response.json()
+    print_response("GET /api/roles/", response, body)
+    assert response.status_code == 200
+    assert len(body) >= 1
+
+
+async def test_create_skill(client):
+    global skill_id
+    response = await _do(client, "POST", URL_SKILLS, SKILL_BODY)
+    print_response("POST /api/skills/", response)
+    assert response.status_code == 201
+    skill_id = _ID_DECODER.decode(response.content).skill_id
+
+
+async def test_list_skills(client):
+    response = await _do(client, "GET", URL_SKILLS)
+    body = response.json()
+    print_response("GET /api/skills/", response, body)
+    assert response.status_code == 200
+    assert len(body) >= 1
+
+
+async def test_create_question(client):
+    global question_id
+    response = await _do(client, "POST", URL_QUESTIONS, QUESTION_BODY)
+    print_response("POST /api/questions/", response)
+    assert response.status_code == 201
+    question_id = _ID_DECODER.decode(response.content).question_id
+
+
+async def test_list_questions(client):
+    response = await _do(
+        client,
+        "GET",
+        URL_QUESTIONS,
+        params={"question_category": "system_design", "question_difficulty": "hard"},
+    )
+    body = response.json()
+    print_response("GET /api/questions/", response, body)
+    assert response.status_code == 200
+    assert body["total"] >= 1
+
+
+async def test_get_question(client):
+    response = await _do(client, "GET", URL_QUESTION_TMPL % question_id)
+    print_response("GET /api/questions/{id}", response)
+    assert response.status_code == 200
+
+
+async def test_update_question(client):
+    response = await _do(
+        client, "PUT", URL_QUESTION_TMPL % question_id, QUESTION_UPDATE_BODY
+    )
+    body = response.json()
+    print_response("PUT /api/questions/{id}", response, body)
+    assert response.status_code == 200
+    assert body["question_difficulty"] == "medium"
+
+
+async def test_create_interview(client):
+    global interview_id
+    # the only body that cannot be precompiled: it embeds runtime ids
+    payload = orjson.dumps(
+        {
+            "company_id": company_id,
+            "role_id": role_id,
+            "candidate_name": "Jane Doe",
+            "interview_type": "mock",
+            "interview_status": "scheduled",
+            "scheduled_at": "2026-09-15T10:00:00",
+            "duration_minutes": 60,
+        }
+    )
+    response = await _do(client, "POST", URL_INTERVIEWS, payload)
+    print_response("POST /api/interviews/", response)
+    assert response.status_code == 201
+    interview_id = _ID_DECODER.decode(response.content).interview_id
+
+
+async def test_list_interviews(client):
+    response = await _do(
+        client, "GET", URL_INTERVIEWS, params={"company_id": company_id}
+    )
+    body = response.json()
+    print_response("GET /api/interviews/", response, body)
+    assert response.status_code == 200
+    assert body["total"] >= 1
+
+
+async def test_get_interview(client):
+    response = await _do(client, "GET", URL_INTERVIEW_TMPL % interview_id)
+    body = response.json()
+    print_response("GET /api/interviews/{id}", response, body)
+    assert response.status_code == 200
+    assert body["company"]["company_id"] == company_id
+
+
+async def test_update_interview(client):
+    response = await _do(
+        client, "PUT", URL_INTERVIEW_TMPL % interview_id, INTERVIEW_UPDATE_BODY
+    )
+    body = response.json()
+    print_response("PUT /api/interviews/{id}", response, body)
+    assert response.status_code == 200
+    assert body["interview_status"] == "completed"
+
+
+async def test_link_question(client):
+    response = await _do(
+        client,
+        "POST",
+        URL_INTERVIEW_QUESTIONS_TMPL % interview_id,
+        params={"question_id": question_id},
+    )
+    print_response("POST /api/interviews/{id}/questions", response)
+    assert response.status_code == 201
+
+
+async def test_create_round(client):
+    response = await _do(
+        client, "POST", URL_INTERVIEW_ROUNDS_TMPL % interview_id, ROUND_BODY
+    )
+    print_response("POST /api/interviews/{id}/rounds", response)
+    assert response.status_code == 201
+
+
+async def test_stats_overview(client):
+    response = await _do(client, "GET", URL_STATS)
+    body = response.json()
+    print_response("GET /api/stats/overview", response, body)
+    assert response.status_code == 200
+    assert body["interviews"] >= 1
+
+
+# declarative test plan: (name, callable, names it depends on). The
+# scheduler below dispatches every entry whose dependencies have
+# finished as one asyncio.gather wave, so the DAG — not hand-unrolled
+# driver code — decides what runs concurrently.
+PLAN = [
+    ("root", test_root, ()),
+    ("health", test_health, ()),
+    ("company", test_create_company, ()),
+    ("role", test_create_role, ()),
+    ("skill", test_create_skill, ()),
+    ("question", test_create_question, ()),
+    ("list_companies", test_list_companies, ("company",)),
+    ("get_company", test_get_company, ("company",)),
+    ("list_roles", test_list_roles, ("role",)),
+    ("list_skills", test_list_skills, ("skill",)),
+    ("list_questions", test_list_questions, ("question",)),
+    ("get_question", test_get_question, ("question",)),
+    ("update_question", test_update_question, ("question",)),
+    ("interview", test_create_interview, ("company", "role")),
+    ("list_interviews", test_list_interviews, ("interview",)),
+    ("get_interview", test_get_interview, ("interview",)),
+    ("link_question", test_link_question, ("interview", "question")),
+    ("round", test_create_round, ("interview",)),
+    ("update_interview", test_update_interview, ("get_interview", "list_interviews")),
+    ("stats", test_stats_overview, ("update_interview", "link_question", "round")),
+]
+
+
+async def main():
+    passed = failed = 0
+    done = set()
+
+    async def one(client, name, test):
+        nonlocal passed, failed
+        try:
+            await test(client)
+        except Exception as e:
+            print(f"\n=== {test.__name__} ===\nFAILED: {e}")
+            failed += 1
+        else:
+            passed += 1
+        done.add(name)
+
+    async with httpx.AsyncClient(
+        base_url=BASE_URL,
+        http2=True,
+        timeout=10,
+        limits=httpx.Limits(max_keepalive_connections=8),
+    ) as client:
+        # warmup: prime the server's route table / DB pool and establish
+        # the keep-alive sockets so the first measured test reuses a warm
+        # connection instead of paying cold-start latency
+        await asyncio.gather(*(_do(client, "GET", URL_HEALTH) for _ in range(4)))
+
+        pending = list(PLAN)
+        while pending:
+            wave = [e for e in pending if all(dep in done for dep in e[2])]
+            pending = [e for e in pending if e not in wave]
+            await asyncio.gather(
+                *(one(client, name, test) for name, test, _ in wave)
+            )
+
+    print(f"\n{'=' * 40}\nPassed: {passed}  Failed: {failed}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(asyncio.run(main()))
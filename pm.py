@@ -0,0 +1,1068 @@
+"""
+PM Case Study Analyzer
+
+LangGraph workflow that takes a product-management case study, classifies
+the problem, asks clarifying questions, recommends a framework from the
+framework library and drafts a complete solution.
+
+Run with:
+    python pm.py
+"""
+
+import asyncio
+import hashlib
+import logging
+import math
+import os
+import tempfile
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Annotated, Dict, List, Optional
+from urllib.parse import parse_qs
+from uuid import uuid4
+
+import aiosqlite
+import httpx
+import openai
+import orjson
+from brotli_asgi import BrotliMiddleware
+import uvicorn
+from fastapi import FastAPI, Header, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_openai import ChatOpenAI, OpenAIEmbeddings
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+from langgraph.graph import END, StateGraph
+from pydantic import BaseModel, ValidationError
+
+from interviewapis.framework import get_frameworks_sync
+
+logger = logging.getLogger("pm")
+logger.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+
+llm = ChatOpenAI(model="gpt-4o", temperature=0.3)
+
+
+# ---------------------------------------------------------------------------
+# Framework library
+# ---------------------------------------------------------------------------
+
+# minimal built-in library used when the framework database is unreachable
+FALLBACK_FRAMEWORKS = {
+    "Product Strategy": [
+        {"name": "North Star Framework", "description": "Anchor teams on one metric that captures product value."},
+        {"name": "Jobs To Be Done", "description": "Frame demand around the job customers hire the product for."},
+    ],
+    "Prioritization": [
+        {"name": "RICE", "description": "Score Reach, Impact, Confidence and Effort to rank work."},
+        {"name": "MoSCoW", "description": "Bucket requirements into Must/Should/Could/Won't."},
+    ],
+    "Growth": [
+        {"name": "AARRR", "description": "Pirate metrics: Acquisition, Activation, Retention, Referral, Revenue."},
+    ],
+    "User Research": [
+        {"name": "Kano Model", "description": "Separate basic, performance and delight features."},
+    ],
+    "Metrics": [
+        {"name": "HEART", "description": "Happiness, Engagement, Adoption, Retention, Task success."},
+    ],
+    "Market Analysis": [
+        {"name": "Porter's Five Forces", "description": "Assess competitive pressure across five forces."},
+    ],
+}
+
+
+def _load_frameworks():
+    try:
+        frameworks: Dict[str, list] = {}
+        for row in get_frameworks_sync():
+            frameworks.setdefault(row.get("category") or "General", []).append(row)
+        if frameworks:
+            return frameworks
+    except Exception as e:
+        logger.warning("FRAMEWORKS: database load failed (%s), using built-in library", e)
+    return FALLBACK_FRAMEWORKS
+
+
+# on-disk cache so N uvicorn workers share one DB query per deploy instead
+# of each repeating it; version key invalidates stale layouts. Stored as
+# JSON, never pickle: the file sits in a shared directory and unpickling
+# bytes another local user could have planted would execute them. Prefer
+# the service's private runtime dir when the platform provides one.
+_FRAMEWORKS_CACHE = Path(
+    os.getenv("FRAMEWORKS_CACHE_PATH")
+    or os.path.join(
+        os.getenv("XDG_RUNTIME_DIR") or tempfile.gettempdir(),
+        "pm_frameworks_cache.json",
+    )
+)
+_FRAMEWORKS_CACHE_TTL = 300
+_FRAMEWORKS_CACHE_VERSION = 1
+
+# starts as the built-in library so imports stay fast; replaced by the DB
+# load on app startup
+FRAMEWORKS = FALLBACK_FRAMEWORKS
+
+
+def _refresh_framework_constants() -> None:
+    global _CATEGORIES, _CATEGORIES_STR, _DEFAULT_CATEGORY
+    _CATEGORIES = list(FRAMEWORKS.keys())
+    _CATEGORIES_STR = "\n- ".join(_CATEGORIES)
+    _DEFAULT_CATEGORY = _CATEGORIES[0]
+
+
+_refresh_framework_constants()
+
+
+def _load_frameworks_cached():
+    try:
+        if (
+            _FRAMEWORKS_CACHE.exists()
+            and time.time() - _FRAMEWORKS_CACHE.stat().st_mtime < _FRAMEWORKS_CACHE_TTL
+        ):
+            payload = orjson.loads(_FRAMEWORKS_CACHE.read_bytes())
+            if (
+                payload.get("version") == _FRAMEWORKS_CACHE_VERSION
+                and payload.get("frameworks")
+            ):
+                return payload["frameworks"]
+    except Exception as e:
+        logger.warning("FRAMEWORKS: cache read failed (%s)", e)
+    frameworks = _load_frameworks()
+    try:
+        _FRAMEWORKS_CACHE.write_bytes(
+            orjson.dumps(
+                {"version": _FRAMEWORKS_CACHE_VERSION, "frameworks": frameworks}
+            )
+        )
+    except Exception as e:
+        logger.warning("FRAMEWORKS: cache write failed (%s)", e)
+    return frameworks
+
+
+# ---------------------------------------------------------------------------
+# Semantic LLM cache
+# ---------------------------------------------------------------------------
+
+
+class SemanticCache:
+    """Embedding nearest-neighbor cache in front of the per-node LLM calls.
+
+    Keys are (node name, normalized prompt text). An exact sha256 layer is
+    consulted first: byte-identical repeats return in microseconds without
+    even an embedding call. On an exact miss the lookup embeds the text
+    with text-embedding-3-small and linearly scans the node's stored
+    vectors; anything within the cosine-distance threshold counts as a hit,
+    so paraphrased case studies short-circuit to the stored result instead
+    of a GPT-4o round trip. Embedding failures degrade to cache misses.
+
+    get/put are async: the embedding call is awaited (never a blocking
+    HTTPS round trip on the event loop) and the linear vector scan runs
+    in a worker thread so a full 512-entry sweep cannot stall other
+    in-flight requests.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.15,
+        max_entries: int = 512,
+        exact_ttl: float = 3600,
+    ):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.exact_ttl = exact_ttl
+        self._embeddings = OpenAIEmbeddings(model="text-embedding-3-small")
+        self._entries: Dict[str, list] = {}
+        self._exact: Dict[str, tuple] = {}
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        return " ".join(text.lower().split())
+
+    @staticmethod
+    def _exact_key(node_name: str, normalized: str) -> str:
+        return node_name + ":" + hashlib.sha256(normalized.encode()).hexdigest()
+
+    async def _embed(self, text: str):
+        vector = await self._embeddings.aembed_query(self._normalize(text))
+        norm = math.sqrt(sum(x * x for x in vector))
+        return [x / norm for x in vector] if norm else vector
+
+    @staticmethod
+    def _scan(entries, vector):
+        best_similarity, best_value = -1.0, None
+        for stored_vector, value in entries:
+            similarity = sum(a * b for a, b in zip(vector, stored_vector))
+            if similarity > best_similarity:
+                best_similarity, best_value = similarity, value
+        return best_similarity, best_value
+
+    async def get(self, node_name: str, text: str):
+        normalized = self._normalize(text)
+        exact = self._exact.get(self._exact_key(node_name, normalized))
+        if exact is not None:
+            expires, value = exact
+            if time.time() < expires:
+                return value
+        entries = self._entries.get(node_name)
+        if not entries:
+            return None
+        try:
+            vector = await self._embed(text)
+        except Exception:
+            return None
+        # snapshot so concurrent puts cannot resize the list mid-scan
+        best_similarity, best_value = await asyncio.to_thread(
+            self._scan, list(entries), vector
+        )
+        if 1.0 - best_similarity <= self.threshold:
+            return best_value
+        return None
+
+    async def put(self, node_name: str, text: str, value) -> None:
+        key = self._exact_key(node_name, self._normalize(text))
+        if len(self._exact) >= self.max_entries:
+            self._exact.pop(next(iter(self._exact)))
+        self._exact[key] = (time.time() + self.exact_ttl, value)
+        try:
+            vector = await self._embed(text)
+        except Exception:
+            return
+        entries = self._entries.setdefault(node_name, [])
+        if len(entries) >= self.max_entries:
+            entries.pop(0)
+        entries.append((vector, value))
+
+
+llm_cache = SemanticCache()
+
+# cross-worker response cache: the in-process caches above are per uvicorn
+# worker, so N workers each pay the LLM cost for the same case study. With
+# REDIS_URL set, whole /api/analyze responses are shared through Redis and
+# a hit anywhere returns in a few milliseconds. Without it (or without
+# redis-py installed) the code path is a no-op.
+try:
+    import redis.asyncio as redis
+except ImportError:
+    redis = None
+
+_REDIS_TTL = 3600
+_redis = (
+    redis.from_url(os.environ["REDIS_URL"])
+    if redis is not None and os.getenv("REDIS_URL")
+    else None
+)
+
+
+def _analyze_cache_key(request) -> str:
+    # JSON-encode the fields rather than concatenating them: an encoded
+    # list is unambiguous, so no two distinct requests share a digest
+    raw = orjson.dumps(
+        [
+            request.case_study,
+            request.additional_context,
+            request.include_clarifying_questions,
+            request.include_complete_solution,
+        ]
+    )
+    return "analyze:" + hashlib.sha256(raw).hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Structured output models
+# ---------------------------------------------------------------------------
+
+
+class ClassificationResult(BaseModel):
+    problem_type: str
+    confidence: Optional[float] = None
+
+
+class ClarifyingQuestions(BaseModel):
+    questions: List[str] = []
+
+
+class FrameworkRecommendation(BaseModel):
+    framework: str
+    reasoning: Optional[str] = None
+    steps: List[str] = []
+
+
+class CompleteSolution(BaseModel):
+    situation_analysis: Dict = {}
+    framework_application: Dict = {}
+    recommendations: List[str] = []
+    success_metrics: List[str] = []
+    risks: List[str] = []
+    next_steps: List[str] = []
+    executive_summary: str = ""
+
+
+class CombinedPMResponse(BaseModel):
+    """Full analysis in one generation: one round-trip instead of four."""
+
+    problem_type: str
+    clarifying_questions: List[str] = []
+    framework_recommendation: FrameworkRecommendation
+    complete_solution: CompleteSolution
+
+
+# ---------------------------------------------------------------------------
+# Prompt chains
+# ---------------------------------------------------------------------------
+
+# templates compile once and pipe straight into structured-output runnables,
+# so per request each node pays a single dict-format .ainvoke; the system
+# fragments stay byte-identical for OpenAI's automatic prompt caching
+
+
+def _build_chains() -> None:
+    global _CLASSIFY_CHAIN, _QUESTIONS_CHAIN, _FRAMEWORK_CHAIN
+    global _SOLUTION_CHAIN, _ANALYZE_CHAIN
+    _CLASSIFY_CHAIN = ChatPromptTemplate.from_messages(
+        [
+            (
+                "system",
+                "You are a Product Management expert who classifies case study "
+                "problems into framework categories.\n\n"
+                "Classify into ONE of these categories:\n- {categories_str}",
+            ),
+            ("user", "Analyze this case study and classify the problem:\n\n{case_study}"),
+        ]
+    ).partial(categories_str=_CATEGORIES_STR) | llm.with_structured_output(
+        ClassificationResult
+    )
+    _QUESTIONS_CHAIN = ChatPromptTemplate.from_messages(
+        [
+            (
+                "system",
+                "You are a Product Management interview coach who asks sharp "
+                "clarifying questions before solving a case.",
+            ),
+            (
+                "user",
+                "For this case study:\n\n{case_study}\n\n"
+                "Generate 3-5 clarifying questions a strong candidate would ask first.",
+            ),
+        ]
+    ) | llm.with_structured_output(ClarifyingQuestions)
+    _FRAMEWORK_CHAIN = ChatPromptTemplate.from_messages(
+        [
+            (
+                "system",
+                "You are a Product Management expert who picks the best "
+                "framework for a case study.",
+            ),
+            (
+                "user",
+                "Case study:\n\n{case_study}\n\nProblem type: {problem_type}\n\n"
+                "Candidate frameworks:\n{candidates_str}\n\n"
+                "Pick the best framework and explain how to apply it.",
+            ),
+        ]
+    ) | llm.with_structured_output(FrameworkRecommendation)
+    _SOLUTION_CHAIN = ChatPromptTemplate.from_messages(
+        [
+            (
+                "system",
+                "You are a Product Management expert writing a complete, "
+                "structured case study solution.",
+            ),
+            (
+                "user",
+                "Case study:\n\n{case_study}\n\n"
+                "Using the {framework} framework, produce a complete solution.",
+            ),
+        ]
+    ) | llm.with_structured_output(CompleteSolution)
+    _ANALYZE_CHAIN = ChatPromptTemplate.from_messages(
+        [
+            (
+                "system",
+                "You are a Product Management expert analyzing a case study "
+                "end to end.\n\n"
+                "Classify the problem into ONE of these categories:\n- {categories_str}\n\n"
+                "Then generate 3-5 clarifying questions, recommend the "
+                "best-fitting framework for that category with reasoning and "
+                "application steps, and write a complete structured solution.",
+            ),
+            ("user", "Case study:\n\n{case_study}"),
+        ]
+    ).partial(categories_str=_CATEGORIES_STR) | llm.with_structured_output(
+        CombinedPMResponse
+    )
+
+
+_build_chains()
+
+
+# ---------------------------------------------------------------------------
+# Workflow state and nodes
+# ---------------------------------------------------------------------------
+
+
+@dataclass(slots=True)
+class PMCaseState:
+    """Workflow state. Slots keep the per-request footprint a contiguous
+    fixed layout instead of an 11-key dict per in-flight request."""
+
+    case_study: str
+    additional_context: Optional[str] = None
+    full_case_study: str = ""
+    include_clarifying_questions: bool = True
+    include_complete_solution: bool = True
+    problem_type: str = ""
+    clarifying_questions: List[str] = field(default_factory=list)
+    framework_recommendation: Dict = field(default_factory=dict)
+    complete_solution: Optional[Dict] = None
+    final_result: Dict = field(default_factory=dict)
+    # parallel branches may both report a failure; keep whichever came last
+    error: Annotated[Optional[str], lambda current, new: new or current] = None
+    timestamp: str = ""
+
+
+async def prepare_input_node(state: PMCaseState) -> dict:
+    # build the case-study text exactly once; every prompt then embeds the
+    # same bytes, which keeps OpenAI's prompt-prefix cache warm across nodes
+    full_case_study = state.case_study
+    if state.additional_context:
+        full_case_study += f". Additional context: {state.additional_context}"
+    return {"full_case_study": full_case_study}
+
+
+async def classify_problem_node(state: PMCaseState) -> dict:
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("CLASSIFY: %s", state.case_study[:80])
+    case_study = state.full_case_study
+
+    cached = await llm_cache.get("classify_problem", case_study)
+    if cached is not None:
+        logger.debug("CLASSIFY: semantic cache hit")
+        return {"problem_type": cached}
+
+    try:
+        result = await _CLASSIFY_CHAIN.ainvoke({"case_study": case_study})
+        problem_type = result.problem_type
+        if problem_type not in FRAMEWORKS:
+            problem_type = _DEFAULT_CATEGORY
+        await llm_cache.put("classify_problem", case_study, problem_type)
+        return {"problem_type": problem_type}
+    except openai.APIError as e:
+        logger.error("CLASSIFY: OpenAI error, aborting pipeline (%s)", e)
+        return {"error": f"classify_problem: {e}", "problem_type": _DEFAULT_CATEGORY}
+    except (ValidationError, KeyError) as e:
+        logger.warning("CLASSIFY: failed (%s), defaulting", e)
+        return {"problem_type": _DEFAULT_CATEGORY}
+
+
+async def generate_questions_node(state: PMCaseState) -> dict:
+    # runs concurrently with recommend_framework_node: return only the keys
+    # this branch owns so LangGraph can merge the parallel updates
+    if not state.include_clarifying_questions:
+        return {"clarifying_questions": []}
+    logger.info("QUESTIONS: generating for problem type %s", state.problem_type)
+
+    cached = await llm_cache.get("generate_questions", state.full_case_study)
+    if cached is not None:
+        logger.debug("QUESTIONS: semantic cache hit")
+        return {"clarifying_questions": cached}
+
+    try:
+        result = await _QUESTIONS_CHAIN.ainvoke(
+            {"case_study": state.full_case_study}
+        )
+        questions = result.questions[:5]
+        await llm_cache.put("generate_questions", state.full_case_study, questions)
+        return {"clarifying_questions": questions}
+    except openai.APIError as e:
+        logger.error("QUESTIONS: OpenAI error, aborting pipeline (%s)", e)
+        return {"error": f"generate_questions: {e}", "clarifying_questions": []}
+    except (ValidationError, KeyError) as e:
+        logger.warning("QUESTIONS: failed (%s), using defaults", e)
+        return {
+            "clarifying_questions": [
+                "Who is the primary user affected by this problem?",
+                "What metric defines success here?",
+                "What constraints (time, budget, team) apply?",
+            ]
+        }
+
+
+async def recommend_framework_node(state: PMCaseState) -> dict:
+    logger.info("FRAMEWORK: recommending for %s", state.problem_type)
+    case_study = state.full_case_study
+
+    cached = await llm_cache.get("recommend_framework", case_study)
+    if cached is not None:
+        logger.debug("FRAMEWORK: semantic cache hit")
+        return {"framework_recommendation": cached}
+
+    candidates = FRAMEWORKS.get(state.problem_type, [])
+    candidates_str = "\n".join(
+        f"- {f['name']}: {f.get('description', '')}" for f in candidates
+    )
+    try:
+        result = await _FRAMEWORK_CHAIN.ainvoke(
+            {
+                "case_study": case_study,
+                "problem_type": state.problem_type,
+                "candidates_str": candidates_str,
+            }
+        )
+        recommendation = result.model_dump()
+        await llm_cache.put("recommend_framework", case_study, recommendation)
+        return {"framework_recommendation": recommendation}
+    except openai.APIError as e:
+        logger.error("FRAMEWORK: OpenAI error, aborting pipeline (%s)", e)
+        return {"error": f"recommend_framework: {e}", "framework_recommendation": {}}
+    except (ValidationError, KeyError) as e:
+        logger.warning("FRAMEWORK: failed (%s), using first candidate", e)
+        return {
+            "framework_recommendation": {
+                "framework": candidates[0]["name"] if candidates else "RICE",
+                "reasoning": "Default recommendation after LLM failure.",
+                "steps": [],
+            }
+        }
+
+
+async def generate_solution_node(state: PMCaseState) -> dict:
+    if not state.include_complete_solution or state.error:
+        return {"complete_solution": None}
+    logger.info("SOLUTION: drafting complete solution")
+    case_study = state.full_case_study
+
+    cached = await llm_cache.get("generate_solution", case_study)
+    if cached is not None:
+        logger.debug("SOLUTION: semantic cache hit")
+        return {"complete_solution": cached}
+
+    framework = state.framework_recommendation.get("framework", "")
+    try:
+        result = await _SOLUTION_CHAIN.ainvoke(
+            {"case_study": case_study, "framework": framework}
+        )
+        solution = result.model_dump()
+        await llm_cache.put("generate_solution", case_study, solution)
+        return {"complete_solution": solution}
+    except openai.APIError as e:
+        logger.error("SOLUTION: OpenAI error, aborting pipeline (%s)", e)
+        return {"error": f"generate_solution: {e}", "complete_solution": None}
+    except (ValidationError, KeyError) as e:
+        logger.warning("SOLUTION: failed (%s), returning stub", e)
+        return {
+            "complete_solution": {
+                "situation_analysis": {},
+                "framework_application": {},
+                "recommendations": [],
+                "success_metrics": [],
+                "risks": [],
+                "next_steps": [],
+                "executive_summary": "Solution generation failed; please retry.",
+            }
+        }
+
+
+async def analyze_case_node(state: PMCaseState) -> dict:
+    """Fused path: classify, question, recommend and solve in ONE GPT-4o call.
+
+    Used when both include_* flags are set (the common case) — same generated
+    tokens as the four granular calls but a single network round-trip and one
+    shared prompt prefix.
+    """
+    logger.info("ANALYZE-NODE: fused single-call analysis")
+    case_study = state.full_case_study
+
+    cached = await llm_cache.get("analyze_case", case_study)
+    if cached is not None:
+        logger.debug("ANALYZE-NODE: semantic cache hit")
+        return cached
+
+    try:
+        result = await _ANALYZE_CHAIN.ainvoke({"case_study": case_study})
+        update = {
+            "problem_type": result.problem_type
+            if result.problem_type in FRAMEWORKS
+            else _DEFAULT_CATEGORY,
+            "clarifying_questions": result.clarifying_questions[:5],
+            "framework_recommendation": result.framework_recommendation.model_dump(),
+            "complete_solution": result.complete_solution.model_dump(),
+        }
+        await llm_cache.put("analyze_case", case_study, update)
+        return update
+    except openai.APIError as e:
+        logger.error("ANALYZE-NODE: OpenAI error, aborting pipeline (%s)", e)
+        return {"error": f"analyze_case: {e}", "complete_solution": None}
+    except (ValidationError, KeyError) as e:
+        logger.warning("ANALYZE-NODE: failed (%s), returning stub", e)
+        return {
+            "problem_type": _DEFAULT_CATEGORY,
+            "clarifying_questions": [],
+            "framework_recommendation": {},
+            "complete_solution": None,
+        }
+
+
+async def compile_result_node(state: PMCaseState) -> dict:
+    logger.debug("COMPILE: assembling final result")
+    return {
+        "final_result": {
+            "problem_type": state.problem_type,
+            "clarifying_questions": state.clarifying_questions,
+            "framework_recommendation": state.framework_recommendation,
+            "complete_solution": state.complete_solution,
+            "error": state.error,
+            "timestamp": datetime.utcnow().isoformat(),
+        }
+    }
+
+
+def _fan_out_or_abort(state: PMCaseState):
+    if state.error:
+        return "compile_result"
+    return ["generate_questions", "recommend_framework"]
+
+
+def _route_entry(state: PMCaseState) -> str:
+    if state.include_clarifying_questions and state.include_complete_solution:
+        return "combined"
+    return "granular"
+
+
+# state is checkpointed after every node, so a retry replays only the failed
+# node instead of re-paying the successful GPT-4o calls. The saver must
+# be the aiosqlite-backed AsyncSqliteSaver: the graph is only ever driven
+# through async APIs (abatch/ainvoke/astream_events), and the sync
+# SqliteSaver raises NotImplementedError from those paths. The connection
+# opens in the lifespan; until then the import-time compile below runs
+# without checkpointing
+_checkpointer = None
+
+
+def build_pm_case_workflow():
+    workflow = StateGraph(PMCaseState)
+    workflow.add_node("prepare_input", prepare_input_node)
+    workflow.add_node("analyze_case", analyze_case_node)
+    workflow.add_node("classify_problem", classify_problem_node)
+    workflow.add_node("generate_questions", generate_questions_node)
+    workflow.add_node("recommend_framework", recommend_framework_node)
+    workflow.add_node("generate_solution", generate_solution_node)
+    workflow.add_node("compile_result", compile_result_node)
+    workflow.set_entry_point("prepare_input")
+    # common case (everything requested): one fused GPT-4o call; the granular
+    # fan-out path remains for requests that skip questions or the solution
+    workflow.add_conditional_edges(
+        "prepare_input",
+        _route_entry,
+        {"combined": "analyze_case", "granular": "classify_problem"},
+    )
+    workflow.add_edge("analyze_case", "compile_result")
+    # questions and framework have no data dependency on each other: fan out
+    # after classification and join before the solution node so the two
+    # OpenAI round-trips overlap; a provider error short-circuits straight
+    # to compile_result instead of burning three more failing calls
+    workflow.add_conditional_edges("classify_problem", _fan_out_or_abort)
+    workflow.add_edge(["generate_questions", "recommend_framework"], "generate_solution")
+    workflow.add_edge("generate_solution", "compile_result")
+    workflow.add_edge("compile_result", END)
+    return workflow.compile(checkpointer=_checkpointer)
+
+
+pm_workflow = build_pm_case_workflow()
+
+
+class RequestBatcher:
+    """Adaptive micro-batcher for concurrent analyze requests.
+
+    Concurrent callers are queued and coalesced into one
+    ``pm_workflow.abatch`` call — up to ``max_batch_size`` states, or
+    whatever arrived within ``max_wait_ms`` of the first. The batched run
+    shares the event loop, HTTP connection pool and prompt prefix across
+    requests, and results are fanned back to callers through per-request
+    futures. A lone request only ever waits the batching window.
+    """
+
+    def __init__(self, max_batch_size: int = 8, max_wait_ms: int = 50):
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def submit(self, state: PMCaseState, config: dict) -> PMCaseState:
+        self.start()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((state, config, future))
+        return await future
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._queue.get(), timeout)
+                    )
+                except asyncio.TimeoutError:
+                    break
+            states = [item[0] for item in batch]
+            configs = [item[1] for item in batch]
+            try:
+                results = await pm_workflow.abatch(states, config=configs)
+            except Exception as e:
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            for (_, _, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+
+batcher = RequestBatcher(
+    max_batch_size=int(os.getenv("ANALYZE_BATCH_SIZE", "8")),
+    max_wait_ms=int(os.getenv("ANALYZE_BATCH_WAIT_MS", "50")),
+)
+
+
+# ---------------------------------------------------------------------------
+# API
+# ---------------------------------------------------------------------------
+
+
+class CaseStudyRequest(BaseModel):
+    case_study: str
+    additional_context: Optional[str] = None
+    request_id: Optional[str] = None
+    include_clarifying_questions: bool = True
+    include_complete_solution: bool = True
+
+
+class AnalysisResponse(BaseModel):
+    problem_type: str
+    clarifying_questions: List[str] = []
+    framework_recommendation: Dict = {}
+    complete_solution: Optional[Dict] = None
+    timestamp: str
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # the DB round-trip happens here (off the import path) so uvicorn workers
+    # start fast; the first worker fills the on-disk cache for the rest
+    global FRAMEWORKS, llm, pm_workflow, _checkpointer
+    FRAMEWORKS = await asyncio.to_thread(_load_frameworks_cached)
+    _refresh_framework_constants()
+    checkpoint_conn = await aiosqlite.connect("./pm_checkpoints.db")
+    _checkpointer = AsyncSqliteSaver(checkpoint_conn)
+    await _checkpointer.setup()
+    # one pooled httpx client behind every chain, warmed below so the
+    # OpenAI DNS + TLS handshake (easily 200-400ms) is paid at boot
+    # rather than by the first /api/analyze
+    http_client = httpx.AsyncClient(
+        timeout=60,
+        limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+    )
+    llm = ChatOpenAI(model="gpt-4o", temperature=0.3, http_async_client=http_client)
+    _build_chains()
+    pm_workflow = build_pm_case_workflow()
+    _rebuild_frameworks_json()
+    if os.environ.get("OPENAI_API_KEY"):
+        try:
+            await http_client.get(
+                "https://api.openai.com/v1/models",
+                headers={
+                    "Authorization": f"Bearer {os.environ['OPENAI_API_KEY']}"
+                },
+            )
+        except httpx.HTTPError as e:
+            logger.warning("STARTUP: OpenAI warm-up failed (%s)", e)
+    logger.info("FRAMEWORKS: %d categories loaded", len(FRAMEWORKS))
+    yield
+    await http_client.aclose()
+    await checkpoint_conn.close()
+
+
+app = FastAPI(
+    title="PM Case Study Analyzer",
+    description="LangGraph-powered product management case study analysis",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
+
+# FastAPI's bool query parsing; mirrored here so the middleware and the
+# stream parameter of /api/analyze agree on what counts as "on"
+_TRUTHY_PARAMS = {"1", "true", "yes", "on"}
+
+
+class SSEAwareBrotliMiddleware(BrotliMiddleware):
+    """BrotliMiddleware that never compresses the opt-in SSE variant.
+
+    The encoder commits to compressing before the response content-type
+    exists, so the stream=true flag of /api/analyze is read from the
+    query string up front and the request's accept-encoding dropped;
+    the parent then passes the event stream through instead of
+    buffering frames into brotli blocks. The dedicated stream route is
+    handled by excluded_handlers.
+    """
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] == "/api/analyze":
+            query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+            stream = query.get("stream", ["false"])[-1].lower()
+            if stream in _TRUTHY_PARAMS:
+                scope = dict(scope)
+                scope["headers"] = [
+                    (name, value)
+                    for name, value in scope["headers"]
+                    if name != b"accept-encoding"
+                ]
+        await super().__call__(scope, receive, send)
+
+
+# complete_solution payloads are long, repetitive JSON that compresses
+# 5-10x; brotli quality 4 beats gzip by ~15-20% on this kind of text for
+# similar CPU and falls back to gzip for clients without br support. The
+# 1KB floor keeps tiny responses like /api/health uncompressed, and the
+# SSE paths are exempted (see SSEAwareBrotliMiddleware) so event frames
+# are never buffered by the encoder.
+app.add_middleware(
+    SSEAwareBrotliMiddleware,
+    quality=4,
+    minimum_size=1024,
+    gzip_fallback=True,
+    excluded_handlers=["/api/analyze/stream"],
+)
+
+
+def _initial_state(request: CaseStudyRequest) -> PMCaseState:
+    return PMCaseState(
+        case_study=request.case_study,
+        additional_context=request.additional_context,
+        include_clarifying_questions=request.include_clarifying_questions,
+        include_complete_solution=request.include_complete_solution,
+    )
+
+
+def _sse_response(initial_state: PMCaseState, config: dict) -> StreamingResponse:
+    async def event_stream():
+        async for event in pm_workflow.astream_events(
+            initial_state, config=config, version="v2"
+        ):
+            if event["event"] == "on_chain_end" and event.get("name") in _STREAM_NODES:
+                payload = orjson.dumps(
+                    {"node": event["name"], "output": event["data"].get("output")},
+                    default=str,
+                    option=orjson.OPT_NON_STR_KEYS,
+                ).decode()
+                yield f"event: {event['name']}\ndata: {payload}\n\n"
+        yield "event: done\ndata: {}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        # no-transform asks proxies not to buffer/recompress the stream;
+        # X-Accel-Buffering disables nginx response buffering
+        headers={"Cache-Control": "no-transform", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.post("/api/analyze", response_model=None)
+async def analyze_case_study(
+    request: CaseStudyRequest,
+    stream: bool = False,
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key"),
+):
+    """Analyze a PM case study. Response shape: ``AnalysisResponse``.
+
+    With ``?stream=true`` the response is SSE, emitting a frame as each
+    node completes instead of buffering the whole result.
+    """
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("ANALYZE: case study: %s", request.case_study[:50])
+    initial_state = _initial_state(request)
+    # retries of the same case study land on the same checkpoint thread, so
+    # only the failed node reruns; an Idempotency-Key header lets clients
+    # scope that dedup themselves
+    thread_id = (
+        request.request_id
+        or idempotency_key
+        or hashlib.sha256(request.case_study.encode()).hexdigest()
+    )
+    config = {"configurable": {"thread_id": thread_id}}
+    if stream:
+        return _sse_response(initial_state, config)
+    cache_key = _analyze_cache_key(request) if _redis is not None else None
+    if cache_key is not None:
+        try:
+            cached = await _redis.get(cache_key)
+        except Exception as e:
+            logger.warning("ANALYZE: redis get failed (%s)", e)
+            cached = None
+        if cached is not None:
+            logger.debug("ANALYZE: redis cache hit")
+            return Response(content=cached, media_type="application/json")
+    final_state = await batcher.submit(initial_state, config)
+    logger.debug("ANALYZE: complete")
+    body = orjson.dumps({**final_state["final_result"], "thread_id": thread_id})
+    if cache_key is not None:
+        try:
+            await _redis.setex(cache_key, _REDIS_TTL, body)
+        except Exception as e:
+            logger.warning("ANALYZE: redis set failed (%s)", e)
+    return Response(content=body, media_type="application/json")
+
+
+@app.post("/api/analyze/resume/{thread_id}")
+async def resume_analysis(thread_id: str):
+    """Resume a checkpointed analysis from its last completed node."""
+    config = {"configurable": {"thread_id": thread_id}}
+    # an unknown thread (typo'd id, pruned checkpoint DB) has no state to
+    # resume from; without this check ainvoke(None) blows up on the
+    # missing required case_study instead of telling the client
+    snapshot = await pm_workflow.aget_state(config)
+    if not snapshot.values:
+        raise HTTPException(status_code=404, detail="No checkpoint for thread")
+    final_state = await pm_workflow.ainvoke(None, config=config)
+    final_result = final_state.get("final_result")
+    if not final_result:
+        raise HTTPException(
+            status_code=409, detail="Analysis did not reach a final result"
+        )
+    return ORJSONResponse({**final_result, "thread_id": thread_id})
+
+
+_STREAM_NODES = {
+    "analyze_case",
+    "classify_problem",
+    "generate_questions",
+    "recommend_framework",
+    "generate_solution",
+    "compile_result",
+}
+
+
+@app.post("/api/analyze/stream")
+async def analyze_case_study_stream(request: CaseStudyRequest):
+    """SSE variant of /api/analyze: emits a frame as each node completes.
+
+    Clients see classification and questions within a couple of seconds
+    while the (much longer) solution generation is still running, instead
+    of waiting for the whole pipeline before the first byte.
+    """
+    config = {"configurable": {"thread_id": request.request_id or uuid4().hex}}
+    return _sse_response(_initial_state(request), config)
+
+
+# both payloads are static between framework reloads: serialize once and
+# serve the cached bytes instead of re-encoding per poll, with strong ETags
+# so the load balancer's health polls 304 instead of refetching
+_FRAMEWORKS_JSON = b"{}"
+_FRAMEWORKS_ETAG = ""
+
+_WORKFLOW_GRAPH_JSON = orjson.dumps(
+    {
+        "nodes": [
+            "prepare_input",
+            "analyze_case",
+            "classify_problem",
+            "generate_questions",
+            "recommend_framework",
+            "generate_solution",
+            "compile_result",
+        ],
+        "edges": [
+            ["prepare_input", "analyze_case"],
+            ["prepare_input", "classify_problem"],
+            ["analyze_case", "compile_result"],
+            ["classify_problem", "generate_questions"],
+            ["classify_problem", "recommend_framework"],
+            ["generate_questions", "generate_solution"],
+            ["recommend_framework", "generate_solution"],
+            ["generate_solution", "compile_result"],
+        ],
+        "description": "PM case study analysis workflow",
+    }
+)
+_WORKFLOW_GRAPH_ETAG = hashlib.md5(_WORKFLOW_GRAPH_JSON).hexdigest()
+
+_HEALTH_JSON = b"{}"
+_HEALTH_ETAG = ""
+
+
+def _cached_json(request: Request, body: bytes, etag: str) -> Response:
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": "public, max-age=300"},
+    )
+
+
+def _rebuild_frameworks_json() -> None:
+    global _FRAMEWORKS_JSON, _FRAMEWORKS_ETAG, _HEALTH_JSON, _HEALTH_ETAG
+    _FRAMEWORKS_JSON = orjson.dumps(
+        {
+            "total_categories": len(FRAMEWORKS),
+            "categories": _CATEGORIES,
+            "frameworks": FRAMEWORKS,
+        }
+    )
+    _FRAMEWORKS_ETAG = hashlib.md5(_FRAMEWORKS_JSON).hexdigest()
+    _HEALTH_JSON = orjson.dumps(
+        {
+            "status": "healthy",
+            "frameworks_loaded": len(FRAMEWORKS),
+            "llm_configured": bool(os.environ.get("OPENAI_API_KEY")),
+            "workflow_ready": pm_workflow is not None,
+            "version": "1.0.0",
+        }
+    )
+    _HEALTH_ETAG = hashlib.md5(_HEALTH_JSON).hexdigest()
+
+
+_rebuild_frameworks_json()
+
+
+@app.get("/api/frameworks")
+async def get_frameworks(request: Request):
+    return _cached_json(request, _FRAMEWORKS_JSON, _FRAMEWORKS_ETAG)
+
+
+@app.get("/api/workflow/graph")
+async def get_workflow_graph(request: Request):
+    return _cached_json(request, _WORKFLOW_GRAPH_JSON, _WORKFLOW_GRAPH_ETAG)
+
+
+@app.get("/api/health")
+async def health_check(request: Request):
+    return _cached_json(request, _HEALTH_JSON, _HEALTH_ETAG)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    logger.info("PM Case Study Analyzer starting")
+    # import string so uvicorn can fork; FRAMEWORKS and pm_workflow are
+    # module-level, so each worker builds them once at import
+    uvicorn.run(
+        "pm:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=int(os.getenv("UVICORN_WORKERS", (os.cpu_count() or 1) * 2 + 1)),
+        loop="uvloop",
+        http="httptools",
+        log_level="warning",
+    )
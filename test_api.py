@@ -0,0 +1,77 @@
+"""
+Smoke-test harness for the PM Case Study Analyzer API.
+
+Start the server (``python pm.py``) and run:
+    python test_api.py
+
+Independent requests share one ``httpx.AsyncClient`` connection pool and
+run concurrently via ``asyncio.gather``, so the suite finishes in roughly
+the time of the slowest analyze call and actually exercises the server's
+parallelism.
+"""
+
+import asyncio
+
+import httpx
+
+BASE_URL = "http://127.0.0.1:8000"
+
+SIMPLE_CASE = {
+    "case_study": "Our mobile app's day-30 retention dropped from 35% to 22% "
+    "over the last quarter. How would you investigate and fix it?",
+    "include_clarifying_questions": True,
+    "include_complete_solution": False,
+}
+
+COMPLETE_CASE = {
+    "case_study": "You are the PM for a B2B analytics product. A large "
+    "competitor just launched a free tier. Design a response strategy.",
+    "additional_context": "Mid-market SaaS, 40-person company, 18 months of runway.",
+    "include_clarifying_questions": True,
+    "include_complete_solution": True,
+}
+
+
+def report(name: str, response: httpx.Response) -> bool:
+    ok = response.status_code == 200
+    print(f"{'PASS' if ok else 'FAIL'}  {name}  [{response.status_code}]")
+    if not ok:
+        print(f"      {response.text[:200]}")
+    return ok
+
+
+async def test_analyze_complete(client: httpx.AsyncClient) -> bool:
+    response = await client.post("/api/analyze", json=COMPLETE_CASE)
+    if not report("POST /api/analyze (complete)", response):
+        return False
+    body = response.json()
+    for key in ("problem_type", "framework_recommendation", "complete_solution"):
+        if key not in body:
+            print(f"      missing key: {key}")
+            return False
+    return True
+
+
+async def main() -> int:
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=120) as client:
+        results = await asyncio.gather(
+            client.get("/api/health"),
+            client.get("/api/frameworks"),
+            client.get("/api/workflow/graph"),
+            client.post("/api/analyze", json=SIMPLE_CASE),
+        )
+        names = [
+            "GET  /api/health",
+            "GET  /api/frameworks",
+            "GET  /api/workflow/graph",
+            "POST /api/analyze (simple)",
+        ]
+        passed = sum(report(name, r) for name, r in zip(names, results))
+        passed += await test_analyze_complete(client)
+    total = len(names) + 1
+    print(f"\n{passed}/{total} passed")
+    return 0 if passed == total else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(asyncio.run(main()))